@@ -3,10 +3,7 @@
 import collections
 import ctypes
 import dataclasses
-import itertools
-import math
 import os
-import random
 import string
 import sys
 import tkinter as tk
@@ -31,6 +28,7 @@ from sten.consts import *
 from sten.crypto import ALPHABET, ciphers
 from sten.data import Border, Color, FilePath, Hotkey, VEvent
 from sten.icons import *
+from sten.lsb import embed, extract, order, possibilities
 from sten.utils import nona, splitext
 
 
@@ -81,8 +79,9 @@ def get(event: tk.Event) -> Optional[str]:
 
         try:
             with Image.open(file) as image:
-                px = math.prod(size := image.size)
-                imgdata = image.getdata()
+                (width, height) = size = image.size
+                px = width * height
+                imgdata = np.asarray(image)
                 mode = image.mode
         except (
                 OSError, DecompressionBombError, DecompressionBombWarning
@@ -106,8 +105,8 @@ def get(event: tk.Event) -> Optional[str]:
 
         # Important! After all error checks are passed, set attributes here!
         Picture.px = px
-        Picture.imgdata = np.array(imgdata)
-        Picture.size = (width, height) = size
+        Picture.imgdata = imgdata.reshape(px, -1)  # Pixel -> Bands
+        Picture.size = size
         Picture.mode = mode
 
         Picture.filename = os.path.basename(filename)
@@ -192,38 +191,15 @@ def encode(event: tk.Event) -> None:
 
     imgdata = Picture.imgdata.copy()
 
-    # Character -> Bit
-    bits = ''.join(format(ord(c), f'0{B}b') for c in message)
+    pixels = order(Picture.px, E_prng.get())
 
-    bits_length = len(bits)
-
-    pixels = list(range(Picture.px))
-
-    if seed := E_prng.get():
-        random.seed(seed)
-        random.shuffle(pixels)
-
-    i = 0
-
-    for p, (c, b) in itertools.product(pixels, Glob.bb):
-        if i >= bits_length:
-            break
-
-        val = format(imgdata[p][c], f'0{B}b')
-
-        pack = val[:B - b] + (_ := bits[i:i + b]) + val[B - b + len(_):]
-
-        # Bit -> File
-        imgdata[p][c] = int(pack, 2)
-
-        i += b
+    # Character -> File
+    embed(imgdata, pixels, Glob.bb, message.encode('ascii'))
 
     shape = *Picture.size[::-1], Picture.imgdata.shape[1]
 
-    array = imgdata.reshape(shape).astype(np.uint8)
-
     try:
-        Image.fromarray(array).save(output)
+        Image.fromarray(imgdata.reshape(shape)).save(output)
     except OSError as err:
         mb.showerror(message=str(err))
         return
@@ -244,50 +220,32 @@ def decode(event: tk.Event) -> None:
 
     cipher = ciphers[name](key)
 
-    pixels = list(range(Picture.px))
-
-    if seed := E_prng.get():
-        random.seed(seed)
-        random.shuffle(pixels)
+    pixels = order(Picture.px, E_prng.get())
 
     if not cnf['BruteLSB'].get():
-        possibilities = [Glob.bb]
+        layouts = (Glob.bb,)
     else:
-        cartesian = itertools.product(range(B + 1), repeat=RGB)
-
-        possibilities = [
-            tuple(itertools.compress(enumerate(t), t)) for t in cartesian
-        ]
-
-    for bb in possibilities:
-        bits, message = '', ''
-
-        for p, (c, b) in itertools.product(pixels, bb):
-            if message.endswith(SUFFIX):
-                break  # No need to go any further
-
-            # File -> Bit
-            bits += format(Picture.imgdata[p][c], f'0{B}b')[-b:]
+        layouts = possibilities()
 
-            if len(bits) >= B:
-                # Bit -> Character
-                message += chr(int(bits[:B], 2))
-                bits = bits[B:]
+    suffix = SUFFIX.encode('ascii')
 
-        if message.endswith(SUFFIX):
+    for bb in layouts:
+        # File -> Character
+        if data := extract(Picture.imgdata, pixels, bb, suffix):
             break
     else:
         mb.showwarning(message='No embedded message found.')
         return
 
-    if nona(message, ALPHABET):
+    # Whatever is left after deleting the alphabet is a non-alphabet byte
+    if data.translate(None, ALPHABET.encode('ascii')):
         mb.showerror(
             message='Message contains a non-alphabet character.',
             detail='ARE YOU SURE THIS MESSAGE WAS CREATED USING STEN?',
         )
         return
 
-    message = message.removesuffix(SUFFIX)
+    message = data.decode('ascii').removesuffix(SUFFIX)
 
     cipher.txt = message
     message = cipher.decrypt()
@@ -380,14 +338,12 @@ def popup(event: tk.Event) -> None:
 
 def always() -> None:
     """Toggle "Always on Top" state."""
-    topmost = root.wm_attributes()[root.wm_attributes().index('-topmost') + 1]
-    root.wm_attributes('-topmost', 1 - topmost)
+    root.wm_attributes('-topmost', 1 - root.wm_attributes('-topmost'))
 
 
 def transparent() -> None:
     """Toggle "Transparent" state."""
-    alpha = root.wm_attributes()[root.wm_attributes().index('-alpha') + 1]
-    root.wm_attributes('-alpha', 1.5 - alpha)
+    root.wm_attributes('-alpha', 1.5 - root.wm_attributes('-alpha'))
 
 
 def activate(event: tk.Event) -> None:
@@ -494,14 +450,15 @@ def f5(event: tk.Event) -> None:
 
     if len(message) > limit:
         # Delete excess message
+        message = message[:limit]
         tabs['message'].delete('1.0', tk.END)
-        tabs['message'].insert('1.0', message[:limit])
+        tabs['message'].insert('1.0', message)
 
-    used = len(tabs['message'].get('1.0', tk.END)[:-1])
+    used = len(message)
 
     left = limit - used
 
-    F_book['text'] = information.substitute(used=used, left=left, limit=limit)
+    F_book['text'] = f'{used}+{left}={limit}'
 
     if event.char in ['']:
         pass
@@ -517,9 +474,13 @@ def f5(event: tk.Event) -> None:
 
 def schedule(ms: int) -> None:
     """Periodic file existence check."""
-    output = Var_output.get()
+    # Nothing to check until a stego-object is created
+    if output := Var_output.get():
+        state = tk.NORMAL if os.path.exists(output) else tk.DISABLED
 
-    B_show['state'] = tk.NORMAL if os.path.exists(output) else tk.DISABLED
+        # Reconfiguring the button redraws it, do so only on a change
+        if str(B_show['state']) != state:
+            B_show['state'] = state
 
     root.after(ms, schedule, ms)
 
@@ -1163,21 +1124,25 @@ F_lsb.grid_configure(
 # LSB Scales #
 ##############
 scales = [
-    tk.Scale(F_lsb, fg=Color.BLACK, from_=B, to=0, troughcolor=color)
-    for color in (Color.RED, Color.GREEN, Color.BLUE)
-]
-
-for scale in scales:
-    scale.set(1)  # <-- Do not change the position of this line!
-
-    scale.configure(
+    tk.Scale(
+        F_lsb,
         bd=Border.THIN,
+        fg=Color.BLACK,
+        from_=B,
         relief=tk.FLAT,
         sliderlength=50,
         sliderrelief=tk.RAISED,
-        state=tk.DISABLED,
         takefocus=True,
+        to=0,
+        troughcolor=color,
     )
+    for color in (Color.RED, Color.GREEN, Color.BLUE)
+]
+
+for scale in scales:
+    scale.set(1)  # <-- A disabled scale ignores `set`, keep it first!
+
+    scale.configure(state=tk.DISABLED)
 
     scale.pack_configure(
         expand=True, fill=tk.BOTH, padx=PX, pady=PY, side=tk.LEFT
@@ -1186,10 +1151,6 @@ for scale in scales:
 ###################
 # Frame: Notebook #
 ###################
-mapping = {'used': 0, 'left': 0, 'limit': 0}
-
-information = string.Template('${used}+${left}=${limit}')
-
 F_book = tk.LabelFrame(
     frame,
     bd=Border.THIN,
@@ -1197,7 +1158,7 @@ F_book = tk.LabelFrame(
     fg=Color.WHITE,
     labelanchor=tk.SE,
     relief=tk.RIDGE,
-    text=information.substitute(mapping),
+    text='0+0=0',  # Used+Left=Limit
 )
 
 F_book.pack_propagate(True)
@@ -1245,7 +1206,7 @@ for title in ['message', 'decoded']:
         text=title.capitalize(),
     )
 
-    tabs.update({title: tab})
+    tabs[title] = tab
 
 
 def start() -> None:
@@ -1,6 +1,7 @@
 """Configuration module."""
 
 import json
+import os
 from contextlib import suppress
 
 
@@ -20,5 +21,14 @@ class Json:
 
     def dump(self, obj: dict[str, bool]) -> None:
         """Serialize `obj` as a JSON formatted stream to a file-like object."""
-        with suppress(OSError), open(self.path, 'w', encoding='utf-8') as file:
-            json.dump(obj, file, separators=(',', ':'))
+        temp = f'{self.path}.tmp'
+
+        # Write aside and swap, never leave a half-written file behind
+        try:
+            with open(temp, 'w', encoding='utf-8') as file:
+                json.dump(obj, file, separators=(',', ':'))
+
+            os.replace(temp, self.path)
+        except OSError:
+            with suppress(OSError):
+                os.unlink(temp)
@@ -1,15 +1,49 @@
 """Ciphers."""
 
 import enum
-import operator
+import functools
 import re
 import string
 from abc import ABC, abstractmethod
 from typing import Any, Literal
 
+import numpy as np
+from numpy.typing import NDArray
+
 from sten.data import Action
 
 ALPHABET = string.printable
+ALPHABET_SET = frozenset(ALPHABET)
+
+SCYTALE_KEY = re.compile(r'[1-9]\d*')
+
+# Index -> Character code
+CODES = np.frombuffer(ALPHABET.encode('ascii'), dtype=np.uint8)
+
+# Character code -> Index, -1 for a non-alphabet character
+INDICES = np.full(128, -1, dtype=np.intp)
+INDICES[CODES] = np.arange(len(ALPHABET))
+
+
+def indices(txt: str) -> NDArray:
+    """Character -> Index."""
+    idx = INDICES[np.frombuffer(txt.encode('ascii'), dtype=np.uint8)]
+
+    if (idx < 0).any():
+        raise ValueError('Not an alphabet character.')
+
+    return idx
+
+
+def characters(idx: NDArray) -> str:
+    """Index -> Character."""
+    return CODES[idx].tobytes().decode('ascii')
+
+
+@functools.lru_cache(maxsize=None)
+def table(shift: int) -> dict[int, int]:
+    """Translation table that shifts the alphabet by `shift` characters."""
+    return str.maketrans(ALPHABET, ALPHABET[shift:] + ALPHABET[:shift])
 
 
 class T(enum.Enum):
@@ -99,20 +133,9 @@ class Caesar(Cipher):
 
     def _do(self, job: T.JOB) -> str:
         """Encrypt/decrypt."""
-        jobs = {
-            '+': operator.add,
-            '-': operator.sub,
-        }
-
-        txt = ''
+        sign = 1 if (job == '+') else -1
 
-        for char in self.txt:
-            it = ALPHABET.index(char)
-            ik = self.key
-
-            txt += ALPHABET[jobs[job](it, ik) % len(ALPHABET)]
-
-        return txt
+        return self.txt.translate(table((sign * self.key) % len(ALPHABET)))
 
 
 class Scytale(Cipher):
@@ -126,27 +149,60 @@ class Scytale(Cipher):
 
     @staticmethod
     def validate(action: str, data: str) -> bool:
-        return (action == Action.DELETE) or bool(re.match(r'^[1-9]\d*$', data))
+        return (action == Action.DELETE) or bool(SCYTALE_KEY.fullmatch(data))
 
     def encrypt(self) -> str:
-        return ''.join(self.txt[i::self.key] for i in range(self.key))
+        key, txt = self.key, self.txt
+
+        # A single row or a single column is left as it is
+        if (key == 1) or (key >= len(txt)):
+            return txt
+
+        return ''.join([txt[i::key] for i in range(key)])
 
     def decrypt(self) -> str:
-        full, mod = divmod(len(self.txt), self.key)
+        size = len(self.txt)
+
+        # Columns past the end of the text are empty, skip them
+        key = min(self.key, size) or 1
+
+        # A single row or a single column is left as it is
+        if (key == 1) or (key == size):
+            return self.txt
+
+        full, mod = divmod(size, key)
 
         rows = full + (mod > 0)
 
-        middle = rows * mod
+        is_ascii = self.txt.isascii()
+
+        # The NumPy scatter below works on bytes, so it takes ASCII only
+        if (key <= rows) or not is_ascii:
+            # ASCII text is scattered as bytes, any other as characters
+            if is_ascii:
+                src, txt = self.txt.encode('ascii'), bytearray(size)
+            else:
+                src, txt = self.txt, [''] * size
+
+            # Scatter each column back to its place, one strided copy each
+            start = 0
+            for column in range(key):
+                stop = start + full + (column < mod)
+                txt[column::key] = src[start:stop]
+                start = stop
 
-        txt = []
+            return txt.decode('ascii') if is_ascii else ''.join(txt)
 
-        for row in range(full):
-            txt.append(self.txt[row:middle:rows])
-            txt.append(self.txt[(middle + row)::full])
+        src = self.txt.encode('ascii')
 
-        txt.append(self.txt[full:middle:rows])
+        # Plain text index of every cipher text character
+        order = np.arange(rows * key).reshape(rows, key).T.ravel()
+        order = order[order < size]
 
-        return ''.join(txt)
+        txt = np.empty(size, dtype=np.uint8)
+        txt[order] = np.frombuffer(src, dtype=np.uint8)
+
+        return txt.tobytes().decode('ascii')
 
 
 class Vigenere(Cipher):
@@ -160,7 +216,7 @@ class Vigenere(Cipher):
 
     @staticmethod
     def validate(action: str, data: str) -> bool:
-        return (action == Action.DELETE) or (data in ALPHABET)
+        return (action == Action.DELETE) or ALPHABET_SET.issuperset(data)
 
     def encrypt(self) -> str:
         return self._do('+')
@@ -170,22 +226,15 @@ class Vigenere(Cipher):
 
     def _do(self, job: T.JOB) -> str:
         """Encrypt/decrypt."""
-        jobs = {
-            '+': operator.add,
-            '-': operator.sub,
-        }
-
-        key = iter((self.key * len(self.txt))[:len(self.txt)])
-
-        txt = ''
+        sign = 1 if (job == '+') else -1
 
-        for char in self.txt:
-            it = ALPHABET.index(char)
-            ik = ALPHABET.index(next(key))
+        it = indices(self.txt)
+        ik = indices(self.key)
 
-            txt += ALPHABET[jobs[job](it, ik) % len(ALPHABET)]
+        # Repeat the key to the length of the text
+        ik = np.tile(ik, -(-it.size // ik.size))[:it.size]
 
-        return txt
+        return characters((it + (sign * ik)) % len(ALPHABET))
 
 
 ciphers = {
@@ -0,0 +1,127 @@
+"""Least significant bit (LSB) embedding."""
+
+import functools
+import itertools
+import random
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from sten.consts import B, RGB
+
+
+@functools.lru_cache(maxsize=1)
+def order(px: int, seed: str) -> NDArray:
+    """Get the order in which the pixels are used, shuffled by `seed`."""
+    if seed:
+        pixels = list(range(px))
+
+        random.seed(seed)
+        random.shuffle(pixels)
+
+        pixels = np.array(pixels, dtype=np.intp)
+    else:
+        pixels = np.arange(px, dtype=np.intp)  # No list of Python ints
+
+    pixels.flags.writeable = False  # Shared between calls
+
+    return pixels
+
+
+@functools.lru_cache(maxsize=None)
+def possibilities() -> tuple[tuple[tuple[int, int], ...], ...]:
+    """Get every band/LSB combination, for the brute force technique."""
+    return tuple(
+        bb for t in itertools.product(range(B + 1), repeat=RGB)
+        if (bb := tuple(itertools.compress(enumerate(t), t)))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def layout(bb: tuple[tuple[int, int], ...]) -> tuple[NDArray, NDArray]:
+    """Get the band and the shift of every bit hidden in a single pixel.
+
+    Bits are hidden band by band, most significant bit first.
+    """
+    bands = np.array([c for c, b in bb for _ in range(b)], dtype=np.intp)
+    shifts = np.array(
+        [s for _, b in bb for s in range(b - 1, -1, -1)], dtype=np.uint8
+    )
+
+    # Shared between calls
+    bands.flags.writeable = False
+    shifts.flags.writeable = False
+
+    return bands, shifts
+
+
+def embed(
+        imgdata: NDArray,
+        pixels: NDArray,
+        bb: tuple[tuple[int, int], ...],
+        data: bytes,
+) -> None:
+    """Hide `data` in the LSBs of `imgdata`, in place."""
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+
+    bands, shifts = layout(bb)
+
+    used = -(-bits.size // bands.size)  # Number of pixels needed
+
+    rows = np.asarray(pixels[:used], dtype=np.intp)[:, np.newaxis]
+    cols = np.array([c for c, _ in bb], dtype=np.intp)
+
+    # Start from the bits already there, so that the bits of the last
+    # pixel which are not overwritten by `data` stay as they are
+    stream = (imgdata[rows, bands] >> shifts) & 1
+
+    stream.flat[:bits.size] = bits
+
+    # Bit -> Band value
+    offsets = np.cumsum([0] + [b for _, b in bb][:-1])
+    values = np.add.reduceat(stream << shifts, offsets, axis=1)
+
+    keep = np.array([(1 << B) - (1 << b) for _, b in bb], dtype=np.uint8)
+
+    imgdata[rows, cols] = (imgdata[rows, cols] & keep) | values
+
+
+def extract(
+        imgdata: NDArray,
+        pixels: NDArray,
+        bb: tuple[tuple[int, int], ...],
+        suffix: bytes,
+) -> Optional[bytes]:
+    """Read the data hidden in the LSBs of `imgdata`, up to `suffix`.
+
+    The returned data ends with `suffix`. Return None if there is none.
+    """
+    bands, shifts = layout(bb)
+
+    if not bands.size:
+        return None
+
+    data = bytearray()
+
+    # Read a few pixels first, a long message is read in growing chunks.
+    # Chunk sizes are multiples of B, so every chunk ends on a byte.
+    start, step = 0, B * 128
+
+    while start < len(pixels):
+        rows = np.asarray(pixels[start:start + step], dtype=np.intp)
+        rows = rows[:, np.newaxis]
+
+        bits = ((imgdata[rows, bands] >> shifts) & 1).ravel()
+
+        # Bit -> Byte, an incomplete byte at the very end is dropped
+        head = max(0, len(data) - len(suffix) + 1)
+        data += np.packbits(bits)[:bits.size // B].tobytes()
+
+        if (end := data.find(suffix, head)) != -1:
+            return bytes(data[:end + len(suffix)])
+
+        start += step
+        step = min(2 * step, B * 65536)
+
+    return None
@@ -4,11 +4,20 @@ import os
 
 
 def nona(chars: str, alphabet: str) -> str:
-    """Get the first non-alphabet character from the given `chars`, if any."""
-    for char in chars:
-        if char not in alphabet:
-            return char
-    return ''
+    """Get the first non-alphabet character from the given `chars`, if any.
+
+    The `alphabet` must be ASCII.
+    """
+    # Only the ASCII part before the first non-ASCII character is searched
+    try:
+        data, other = chars.encode('ascii'), ''
+    except UnicodeEncodeError as err:
+        data, other = chars[:err.start].encode('ascii'), chars[err.start]
+
+    # Delete every alphabet character, what is left keeps its order
+    rest = data.translate(None, alphabet.encode('ascii'))
+
+    return chr(rest[0]) if rest else other
 
 
 def splitext(path: str) -> tuple[str, str]: